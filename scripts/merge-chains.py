@@ -15,8 +15,23 @@ Options:
 
 import json
 import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec.json
+except ImportError:
+    msgspec = None
+
 # Base paths
 SCRIPT_DIR = Path(__file__).parent
 ROOT_DIR = SCRIPT_DIR.parent
@@ -34,6 +49,12 @@ BROKEN_CHAIN_KEYWORDS = [
     'deepbrain',
 ]
 
+# Compiled once so each chain name is scanned in a single pass
+BROKEN_CHAIN_RE = re.compile('|'.join(re.escape(k) for k in BROKEN_CHAIN_KEYWORDS))
+
+# Sentinel reason for chains shadowed by a Pezkuwi chain with the same id
+_DUPLICATE = 'duplicate'
+
 # These chains have broken endpoints or are not useful
 EXCLUDED_CHAIN_IDS = {
     # AlephZero - DNS failures
@@ -52,51 +73,91 @@ EXCLUDED_CHAIN_IDS = {
     'eip155:2109',
 }
 
+# Interned frozenset: membership tests against interned chainIds become
+# pointer comparisons with cached hashes
+EXCLUDED_CHAIN_IDS = frozenset(sys.intern(cid) for cid in EXCLUDED_CHAIN_IDS)
+
 
 def load_json(path: Path) -> list | dict:
     """Load JSON file."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    if msgspec is not None:
+        return msgspec.json.decode(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+def dumps_bytes(data: list | dict, indent: int = 2) -> bytes:
+    """Serialize to the bytes save_json would write."""
+    if orjson is not None and indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if msgspec is not None:
+        return msgspec.json.format(msgspec.json.encode(data), indent=indent)
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
 
 
 def save_json(path: Path, data: list | dict, indent: int = 2):
     """Save JSON file."""
+    save_bytes(path, dumps_bytes(data, indent))
+
+
+def save_bytes(path: Path, buf: bytes):
+    """Save pre-serialized JSON bytes."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    # Write-to-temp + atomic rename: never write through the existing inode,
+    # which may be hardlinked to another version's output by a previous sync
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_bytes(buf)
+    os.replace(tmp, path)
     print(f"✓ Saved: {path}")
 
 
-def is_chain_excluded(chain: dict) -> tuple[bool, str]:
-    """
-    Check if a chain should be excluded.
+def link_or_write(src: Path, dst: Path, buf: bytes):
+    """Hardlink dst to an already-written copy, falling back to an atomic write."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+        print(f"✓ Saved: {dst}")
+    except OSError:
+        save_bytes(dst, buf)
 
-    Returns:
-        (excluded: bool, reason: str)
-    """
-    chain_id = chain.get('chainId', '')
-    name = chain.get('name', '')
-    options = chain.get('options', [])
 
+def _exclusion_reason(chain_id: str, name: str, options) -> str | None:
+    """Exclusion logic over the three fields the filter actually reads."""
     # Check explicit exclusion list
     if chain_id in EXCLUDED_CHAIN_IDS:
-        return True, "broken RPC"
+        return "broken RPC"
 
     # Check for PAUSED chains
     if 'PAUSED' in name:
-        return True, "PAUSED"
+        return "PAUSED"
+
+    name_lower = name.lower()
 
     # Check for testnets (but NOT Pezkuwi testnets)
-    if 'testnet' in options and 'pezkuwi' not in name.lower() and 'zagros' not in name.lower():
-        return True, "testnet"
+    if 'testnet' in options and 'pezkuwi' not in name_lower and 'zagros' not in name_lower:
+        return "testnet"
 
     # Check for broken chain keywords
-    name_lower = name.lower()
-    for keyword in BROKEN_CHAIN_KEYWORDS:
-        if keyword in name_lower:
-            return True, f"broken ({keyword})"
+    match = BROKEN_CHAIN_RE.search(name_lower)
+    if match:
+        return f"broken ({match.group(0)})"
+
+    return None
+
+
+def is_chain_excluded(chain: dict) -> tuple[bool, str]:
+    """
+    Check if a chain should be excluded.
 
-    return False, ""
+    Returns:
+        (excluded: bool, reason: str)
+    """
+    reason = _exclusion_reason(
+        chain.get('chainId', ''), chain.get('name', ''), chain.get('options', ())
+    )
+    return (True, reason) if reason is not None else (False, "")
 
 
 def merge_chains(nova_chains: list, pezkuwi_chains: list, filter_broken: bool = True) -> tuple[list, dict]:
@@ -114,42 +175,57 @@ def merge_chains(nova_chains: list, pezkuwi_chains: list, filter_broken: bool =
     # Create a set of Pezkuwi chain IDs to avoid duplicates
     pezkuwi_chain_ids = {c['chainId'] for c in pezkuwi_chains}
 
+    # 64-bit Bloom mask over the (small) Pezkuwi id set: rejects most Nova
+    # ids with one shift-and-test before falling through to the set probe
+    pezkuwi_mask = 0
+    for cid in pezkuwi_chain_ids:
+        pezkuwi_mask |= 1 << (hash(cid) & 63)
+
+    # Columnar (SoA) view of the fields the filter reads; the keep pass walks
+    # these flat tuples and only touches the full chain dicts when the kept
+    # subset is materialized at the end
+    def _columns(chain, intern=sys.intern):
+        # chainId and name are always present in practice; the except path
+        # keeps the old .get defaults for malformed entries
+        try:
+            return intern(chain['chainId']), chain['name'], tuple(chain.get('options', ()))
+        except KeyError:
+            return (intern(chain.get('chainId', '')), chain.get('name', 'Unknown'),
+                    tuple(chain.get('options', ())))
+
+    if nova_chains:
+        ids, names, options = zip(*map(_columns, nova_chains))
+    else:
+        ids = names = options = ()
+
+    # Loop-invariant lookups bound to locals for the per-chain fast path
+    in_pezkuwi = pezkuwi_chain_ids.__contains__
+    exclusion_reason = _exclusion_reason
+
+    reasons: list[str | None] = [None] * len(nova_chains)
+    for i, chain_id in enumerate(ids):
+        if (pezkuwi_mask >> (hash(chain_id) & 63)) & 1 and in_pezkuwi(chain_id):
+            reasons[i] = _DUPLICATE
+        elif filter_broken:
+            reasons[i] = exclusion_reason(chain_id, names[i], options[i])
+
+    nova_filtered = [nova_chains[i] for i, r in enumerate(reasons) if r is None]
+    excluded_chains = [
+        (names[i], r) for i, r in enumerate(reasons)
+        if r is not None and r is not _DUPLICATE
+    ]
+
     stats = {
         'pezkuwi': len(pezkuwi_chains),
         'nova_total': len(nova_chains),
-        'nova_included': 0,
-        'excluded_paused': 0,
-        'excluded_testnet': 0,
-        'excluded_broken': 0,
-        'excluded_duplicate': 0,
+        'nova_included': len(nova_filtered),
+        'excluded_paused': sum('PAUSED' in r for _, r in excluded_chains),
+        'excluded_testnet': sum('testnet' in r for _, r in excluded_chains),
+        'excluded_duplicate': sum(r is _DUPLICATE for r in reasons),
     }
-
-    nova_filtered = []
-    excluded_chains = []
-
-    for chain in nova_chains:
-        chain_id = chain.get('chainId', '')
-
-        # Skip duplicates
-        if chain_id in pezkuwi_chain_ids:
-            stats['excluded_duplicate'] += 1
-            continue
-
-        # Check if should be excluded
-        if filter_broken:
-            excluded, reason = is_chain_excluded(chain)
-            if excluded:
-                excluded_chains.append((chain.get('name', 'Unknown'), reason))
-                if 'PAUSED' in reason:
-                    stats['excluded_paused'] += 1
-                elif 'testnet' in reason:
-                    stats['excluded_testnet'] += 1
-                else:
-                    stats['excluded_broken'] += 1
-                continue
-
-        nova_filtered.append(chain)
-        stats['nova_included'] += 1
+    stats['excluded_broken'] = (
+        len(excluded_chains) - stats['excluded_paused'] - stats['excluded_testnet']
+    )
 
     # Pezkuwi first, then Nova
     merged = pezkuwi_chains + nova_filtered
@@ -215,23 +291,50 @@ def merge_version(version: str = "v22", filter_broken: bool = True):
     print(f"  TOTAL OUTPUT:       {stats['total']:3} chains")
     print(f"{'─'*40}")
 
-    # Save
-    save_json(output_path, merged)
-
-    # Also copy to root chains.json for compatibility
-    root_output = OUTPUT_DIR / "chains.json"
-    save_json(root_output, merged)
+    # Save - serialize once, the android output is identical bytes. The root
+    # chains.json compatibility copy is written by main() after all versions
+    # finish, so pool workers never race on the shared path.
+    buf = dumps_bytes(merged)
+    save_bytes(output_path, buf)
 
     # Also save to android subdirectory (this is what the app fetches)
     android_output = OUTPUT_DIR / version / "android" / "chains.json"
-    save_json(android_output, merged)
+    link_or_write(output_path, android_output, buf)
 
     return True
 
 
+def _nova_git_dir() -> Path | None:
+    """Resolve nova-base's real git dir.
+
+    In a submodule checkout nova-base/.git is a pointer file
+    ("gitdir: ../.git/modules/nova-base"), not a directory.
+    """
+    git_path = NOVA_BASE / ".git"
+    if git_path.is_dir():
+        return git_path
+    try:
+        pointer = git_path.read_text(encoding='utf-8')
+    except OSError:
+        return None
+    if pointer.startswith("gitdir:"):
+        return (NOVA_BASE / pointer.split(":", 1)[1].strip()).resolve()
+    return None
+
+
 def update_nova_submodule():
     """Pull latest Nova changes."""
     import subprocess
+    import time
+
+    # Skip the network round-trip when the submodule was fetched recently
+    git_dir = _nova_git_dir()
+    fetch_head = git_dir / "FETCH_HEAD" if git_dir is not None else None
+    if fetch_head is not None and fetch_head.exists() \
+            and time.time() - fetch_head.stat().st_mtime < 3600:
+        print("\nNova submodule fetched less than an hour ago, skipping update")
+        return
+
     print("\nUpdating Nova submodule...")
     try:
         result = subprocess.run(
@@ -268,14 +371,22 @@ def main():
     # Filter by default (unless --full specified)
     filter_broken = not args.full
 
-    # Merge
+    # Merge - versions are independent, so a process pool runs their JSON
+    # parse/filter/write work in parallel
     if args.all:
         versions = ["v21", "v22"]
-        for v in versions:
-            merge_version(v, filter_broken)
+        with ProcessPoolExecutor(max_workers=min(4, len(versions))) as executor:
+            list(executor.map(merge_version, versions, repeat(filter_broken)))
     else:
+        versions = [args.version]
         merge_version(args.version, filter_broken)
 
+    # Root chains.json mirrors the last merged version for compatibility -
+    # written once here, after all workers are done
+    last_output = OUTPUT_DIR / versions[-1] / "chains.json"
+    if last_output.exists():
+        link_or_write(last_output, OUTPUT_DIR / "chains.json", last_output.read_bytes())
+
     print("\n" + "="*60)
     print("✓ Merge complete!")
     print("="*60)
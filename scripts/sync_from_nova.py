@@ -18,10 +18,28 @@ Rules:
   - Pezkuwi chains appear first in the list
 """
 
+import hashlib
+import itertools
 import json
+import mmap
+import os
 import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec.json
+except ImportError:
+    msgspec = None
+
 ROOT = Path(__file__).parent.parent
 NOVA_BASE = ROOT / "nova-base"
 PEZKUWI_OVERLAY = ROOT / "pezkuwi-overlay"
@@ -30,16 +48,246 @@ OUTPUT_XCM = ROOT / "xcm"
 OUTPUT_STAKING = ROOT / "staking"
 
 
+# Files below this size parse faster from a plain read than an mmap
+_MMAP_THRESHOLD = 64 * 1024
+
+
 def load_json(path: Path) -> dict | list:
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    if orjson is not None:
+        if path.stat().st_size > _MMAP_THRESHOLD:
+            # Zero-copy parse straight from the page cache
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+        return orjson.loads(path.read_bytes())
+    if msgspec is not None:
+        return msgspec.json.decode(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+@lru_cache(maxsize=64)
+def load_json_cached(path_str: str) -> dict | list:
+    """Parse a file at most once per run; callers must treat the result as read-only."""
+    return load_json(Path(path_str))
+
+
+@lru_cache(maxsize=None)
+def load_pezkuwi_chains(path_str: str, mtime_ns: int) -> tuple[tuple, frozenset]:
+    """Cached (chains, chain ids) for the Pezkuwi overlay, keyed on path + mtime."""
+    chains = load_json(Path(path_str))
+    return tuple(chains), frozenset(c['chainId'] for c in chains)
+
+
+# JSON outputs are accumulated as (path, bytes) pairs during the merge phase
+# and issued in one parallel burst by flush_writes() in main(), keeping the
+# syscall traffic bunched instead of interleaved with compute
+_write_pool = ThreadPoolExecutor(max_workers=4)
+_pending_lock = threading.Lock()
+_pending_outputs: list[tuple[Path, bytes]] = []
+
+
+def dumps_bytes(data: dict | list) -> bytes:
+    """Serialize to the bytes save_json writes."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    if msgspec is not None:
+        return msgspec.json.format(msgspec.json.encode(data), indent=2) + b'\n'
+    return (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+# mkdir costs a syscall per output even when hundreds of files share a
+# parent; remember the directories already ensured this run
+_ensured_dirs: set[str] = set()
+
+
+def _ensure_dir(dirpath: str):
+    if dirpath not in _ensured_dirs:
+        os.makedirs(dirpath, exist_ok=True)
+        _ensured_dirs.add(dirpath)
+
+
+# Content-addressed outputs: buffers already written this run are hardlinked
+# instead of rewritten (chains.json vs android/chains.json, and version dirs
+# whose merge result did not change)
+_content_lock = threading.Lock()
+_content_paths: dict[bytes, Path] = {}
+
+
+def _write_bytes(path: Path, buf: bytes):
+    # The lock only guards the digest map; disk I/O runs unlocked so the pool
+    # workers actually overlap. A path is recorded only after its rename
+    # lands, so the worst race is a missed dedup (two plain writes).
+    digest = hashlib.blake2b(buf, digest_size=16).digest()
+
+    # Leave byte-identical outputs untouched so their mtimes are stable
+    # and downstream git/CI sees no change
+    try:
+        if path.read_bytes() == buf:
+            with _content_lock:
+                _content_paths.setdefault(digest, path)
+            return
+    except OSError:
+        pass
+
+    _ensure_dir(os.fspath(path.parent))
+    with _content_lock:
+        written = _content_paths.get(digest)
+    if written is not None and written != path:
+        path.unlink(missing_ok=True)
+        try:
+            os.link(written, path)
+            return
+        except OSError:
+            pass
+
+    # Write-to-temp + atomic rename: readers never observe partial JSON
+    # and a failed run cannot leave a truncated output behind
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_bytes(buf)
+    os.replace(tmp, path)
+    with _content_lock:
+        _content_paths.setdefault(digest, path)
+
+
+def save_bytes(path: Path, buf: bytes):
+    with _pending_lock:
+        _pending_outputs.append((path, buf))
 
 
 def save_json(path: Path, data: dict | list):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write('\n')
+    save_bytes(path, dumps_bytes(data))
+
+
+def flush_writes():
+    """Issue every queued JSON write in one parallel burst and wait for it."""
+    with _pending_lock:
+        outputs = _pending_outputs[:]
+        _pending_outputs.clear()
+    for _ in _write_pool.map(lambda out: _write_bytes(*out), outputs):
+        pass
+
+
+def _index_tree(root: str) -> dict[str, os.stat_result]:
+    """Map path-relative-to-root -> stat for every file under root."""
+    files = {}
+    prefix_len = len(root) + 1
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            full = os.path.join(dirpath, name)
+            files[full[prefix_len:]] = os.stat(full)
+    return files
+
+
+def sync_tree(src: Path, dst: Path):
+    """Incrementally mirror src into dst: copy new/changed files, drop stale ones."""
+    # Plain strings in the per-file loop - Path arithmetic costs a parse
+    # and an allocation per operation
+    src_root, dst_root = os.fspath(src), os.fspath(dst)
+    src_files = _index_tree(src_root)
+    dst_files = _index_tree(dst_root) if os.path.isdir(dst_root) else {}
+
+    for rel, st in src_files.items():
+        dst_st = dst_files.get(rel)
+        if dst_st is None or dst_st.st_size != st.st_size or dst_st.st_mtime < st.st_mtime:
+            source = os.path.join(src_root, rel)
+            target = os.path.join(dst_root, rel)
+            _ensure_dir(os.path.dirname(target))
+            if dst_st is not None:
+                os.unlink(target)
+            # Hardlink clone - O(inodes) instead of O(bytes) on one filesystem
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+
+    # Files that disappeared from the source
+    for rel in dst_files.keys() - src_files.keys():
+        os.unlink(os.path.join(dst_root, rel))
+
+
+# Input mtime cache: a Nova input whose mtime is unchanged since the last
+# successful sync - and whose outputs still carry the mtimes recorded at
+# that sync - is skipped entirely. The output mtimes matter: another tool
+# (merge-chains.py) writes some of the same paths, and a bare existence
+# check would leave its content in place forever. The cache is invalidated
+# wholesale when any Pezkuwi overlay file changes.
+SYNC_CACHE = ROOT / ".sync_cache.json"
+_cached_inputs: dict[str, dict] = {}
+_seen_inputs: dict[str, dict] = {}
+
+
+def _overlay_fingerprint() -> dict[str, int]:
+    overlay_files = [
+        PEZKUWI_OVERLAY / "chains" / "pezkuwi-chains.json",
+        PEZKUWI_OVERLAY / "chains" / "blocked-chains.json",
+        PEZKUWI_OVERLAY / "xcm" / "pezkuwi-xcm.json",
+        PEZKUWI_OVERLAY / "xcm" / "pezkuwi-xcm-dynamic.json",
+        PEZKUWI_OVERLAY / "config" / "global_config_overlay.json",
+    ]
+    return {f.name: f.stat().st_mtime_ns for f in overlay_files if f.exists()}
+
+
+def load_sync_cache():
+    global _cached_inputs
+    try:
+        cache = json.loads(SYNC_CACHE.read_bytes())
+    except (OSError, ValueError):
+        return
+    if cache.get('overlay') == _overlay_fingerprint():
+        _cached_inputs = cache.get('inputs', {})
+
+
+def save_sync_cache():
+    # Runs after flush_writes, so the outputs' final mtimes are on disk
+    inputs = {}
+    for key, seen in _seen_inputs.items():
+        output_mtimes = {}
+        for out in seen['outputs']:
+            try:
+                output_mtimes[out] = os.stat(out).st_mtime_ns
+            except OSError:
+                pass
+        inputs[key] = {'mtime_ns': seen['mtime_ns'], 'outputs': output_mtimes}
+    SYNC_CACHE.write_bytes(
+        dumps_bytes({'overlay': _overlay_fingerprint(), 'inputs': inputs})
+    )
+
+
+def input_unchanged(src: Path, outputs: list[Path]) -> bool:
+    """True when src is unchanged since the cached sync and the outputs still
+    carry the mtimes recorded when this script wrote them."""
+    key = str(src)
+    mtime_ns = os.stat(src).st_mtime_ns
+    _seen_inputs[key] = {'mtime_ns': mtime_ns, 'outputs': [str(p) for p in outputs]}
+
+    cached = _cached_inputs.get(key)
+    if not isinstance(cached, dict) or cached.get('mtime_ns') != mtime_ns:
+        return False
+    cached_outputs = cached.get('outputs', {})
+    for output in outputs:
+        try:
+            if os.stat(output).st_mtime_ns != cached_outputs.get(str(output)):
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _versions(subdir: str) -> list[Path]:
+    """Version dirs under nova-base/<subdir>, sorted numerically (v2 < v10)."""
+    root = NOVA_BASE / subdir
+    if not root.is_dir():
+        return []
+    with os.scandir(root) as it:
+        entries = [
+            e for e in it
+            if e.is_dir(follow_symlinks=False) and e.name.startswith('v') and e.name[1:].isdigit()
+        ]
+    entries.sort(key=lambda e: int(e.name[1:]))
+    return [root / e.name for e in entries]
 
 
 def load_blacklist() -> set:
@@ -51,17 +299,30 @@ def load_blacklist() -> set:
     return set()
 
 
-def merge_chains(nova_chains: list, pezkuwi_chains: list, blocked_ids: set) -> list:
-    """Pezkuwi chains first, then Nova chains. Blocked chains excluded."""
-    pezkuwi_ids = {c['chainId'] for c in pezkuwi_chains}
-    nova_filtered = [
-        c for c in nova_chains
-        if c['chainId'] not in pezkuwi_ids and c['chainId'] not in blocked_ids
-    ]
-    return pezkuwi_chains + nova_filtered
+def merge_chains(nova_chains: list, pezkuwi_chains: list | tuple, blocked_ids: set) -> list:
+    """Pezkuwi chains first, then Nova chains. Blocked chains excluded.
+
+    One pass over each input: the insertion-ordered dict keeps Pezkuwi
+    entries first and setdefault drops Nova duplicates for free.
+    """
+    merged = {c['chainId']: c for c in pezkuwi_chains}
+    for c in nova_chains:
+        chain_id = c['chainId']
+        if chain_id not in blocked_ids:
+            merged.setdefault(chain_id, c)
+    return list(merged.values())
+
+
+def _dict_merge(base: dict | None, overlay: dict | None) -> dict:
+    """Copy base and overlay it - hashes each key once, unlike {**a, **b}."""
+    merged = base.copy() if base else {}
+    if overlay:
+        merged.update(overlay)
+    return merged
 
 
-def merge_xcm(nova_xcm: dict, pezkuwi_xcm: dict) -> dict:
+def merge_xcm(nova_xcm: dict, pezkuwi_xcm: dict,
+              pezkuwi_chain_ids: frozenset | None = None) -> dict:
     """
     Merge XCM: Nova base + Pezkuwi entries added to EACH section.
 
@@ -70,38 +331,70 @@ def merge_xcm(nova_xcm: dict, pezkuwi_xcm: dict) -> dict:
     merged = {}
 
     # 1. assetsLocation - dict, Pezkuwi overrides/adds
-    merged['assetsLocation'] = {
-        **nova_xcm.get('assetsLocation', {}),
-        **pezkuwi_xcm.get('assetsLocation', {})
-    }
+    merged['assetsLocation'] = _dict_merge(
+        nova_xcm.get('assetsLocation'), pezkuwi_xcm.get('assetsLocation')
+    )
 
     # 2. instructions - dict, keep Nova's (Pezkuwi uses same instruction types)
     if 'instructions' in nova_xcm:
         merged['instructions'] = nova_xcm['instructions']
 
     # 3. networkDeliveryFee - dict keyed by chainId, Pezkuwi adds entries
-    merged['networkDeliveryFee'] = {
-        **nova_xcm.get('networkDeliveryFee', {}),
-        **pezkuwi_xcm.get('networkDeliveryFee', {})
-    }
+    merged['networkDeliveryFee'] = _dict_merge(
+        nova_xcm.get('networkDeliveryFee'), pezkuwi_xcm.get('networkDeliveryFee')
+    )
 
     # 4. networkBaseWeight - dict keyed by chainId, Pezkuwi adds entries
-    merged['networkBaseWeight'] = {
-        **nova_xcm.get('networkBaseWeight', {}),
-        **pezkuwi_xcm.get('networkBaseWeight', {})
-    }
-
-    # 5. chains - list, Pezkuwi first then Nova (no duplicates)
-    pezkuwi_chain_ids = {c['chainId'] for c in pezkuwi_xcm.get('chains', [])}
-    nova_chains_filtered = [
-        c for c in nova_xcm.get('chains', [])
-        if c['chainId'] not in pezkuwi_chain_ids
-    ]
-    merged['chains'] = pezkuwi_xcm.get('chains', []) + nova_chains_filtered
+    merged['networkBaseWeight'] = _dict_merge(
+        nova_xcm.get('networkBaseWeight'), pezkuwi_xcm.get('networkBaseWeight')
+    )
+
+    # 5. chains - list, Pezkuwi first then Nova (no duplicates); the filtered
+    # Nova part streams through itertools.chain so only the final list is built
+    if pezkuwi_chain_ids is None:
+        pezkuwi_chain_ids = frozenset(c['chainId'] for c in pezkuwi_xcm.get('chains', []))
+    merged['chains'] = list(itertools.chain(
+        pezkuwi_xcm.get('chains', []),
+        (c for c in nova_xcm.get('chains', []) if c['chainId'] not in pezkuwi_chain_ids),
+    ))
 
     return merged
 
 
+def _sync_chains_version(version_dir: Path, pezkuwi_chains: list | tuple,
+                         blocked_ids: set) -> str:
+    """Merge one chains/v* directory; returns the log lines to print."""
+    version = version_dir.name
+    output_dir = OUTPUT_CHAINS / version
+    log = []
+
+    # chains.json - serialized once, android/chains.json reuses the bytes
+    nova_file = version_dir / "chains.json"
+    output_chains = output_dir / "chains.json"
+    output_android = output_dir / "android" / "chains.json"
+    if nova_file.exists() and not input_unchanged(nova_file, [output_chains, output_android]):
+        nova_chains = load_json_cached(str(nova_file))
+        merged = merge_chains(nova_chains, pezkuwi_chains, blocked_ids)
+        merged_buf = dumps_bytes(merged)
+        save_bytes(output_chains, merged_buf)
+        save_bytes(output_android, merged_buf)
+        log.append(f"  {version}/chains.json: {len(pezkuwi_chains)} + {len(nova_chains)} - {len(blocked_ids)} blocked = {len(merged)}")
+
+    # chains_dev.json
+    nova_dev = version_dir / "chains_dev.json"
+    if nova_dev.exists() and not input_unchanged(nova_dev, [output_dir / "chains_dev.json"]):
+        nova_chains = load_json(nova_dev)
+        merged = merge_chains(nova_chains, pezkuwi_chains, blocked_ids)
+        save_json(output_dir / "chains_dev.json", merged)
+
+    # preConfigured (mirror from Nova, only touching changed files)
+    nova_preconfig = version_dir / "preConfigured"
+    if nova_preconfig.exists():
+        sync_tree(nova_preconfig, output_dir / "preConfigured")
+
+    return "\n".join(log)
+
+
 def sync_chains():
     print("Syncing chains...")
 
@@ -109,40 +402,25 @@ def sync_chains():
     print(f"  Blacklist: {len(blocked_ids)} chains excluded")
 
     pezkuwi_chains_file = PEZKUWI_OVERLAY / "chains" / "pezkuwi-chains.json"
-    pezkuwi_chains = load_json(pezkuwi_chains_file) if pezkuwi_chains_file.exists() else []
+    if pezkuwi_chains_file.exists():
+        pezkuwi_chains, _ = load_pezkuwi_chains(
+            str(pezkuwi_chains_file), pezkuwi_chains_file.stat().st_mtime_ns
+        )
+    else:
+        pezkuwi_chains = ()
     print(f"  Pezkuwi: {len(pezkuwi_chains)} chains")
 
-    for version_dir in sorted(NOVA_BASE.glob("chains/v*")):
-        version = version_dir.name
-        output_dir = OUTPUT_CHAINS / version
-
-        # chains.json
-        nova_file = version_dir / "chains.json"
-        if nova_file.exists():
-            nova_chains = load_json(nova_file)
-            merged = merge_chains(nova_chains, pezkuwi_chains, blocked_ids)
-            save_json(output_dir / "chains.json", merged)
-            print(f"  {version}/chains.json: {len(pezkuwi_chains)} + {len(nova_chains)} - {len(blocked_ids)} blocked = {len(merged)}")
-
-        # chains_dev.json
-        nova_dev = version_dir / "chains_dev.json"
-        if nova_dev.exists():
-            nova_chains = load_json(nova_dev)
-            merged = merge_chains(nova_chains, pezkuwi_chains, blocked_ids)
-            save_json(output_dir / "chains_dev.json", merged)
-
-        # android/chains.json
-        android_dir = output_dir / "android"
-        if nova_file.exists():
-            save_json(android_dir / "chains.json", merge_chains(load_json(nova_file), pezkuwi_chains, blocked_ids))
-
-        # preConfigured (copy from Nova)
-        nova_preconfig = version_dir / "preConfigured"
-        if nova_preconfig.exists():
-            output_preconfig = output_dir / "preConfigured"
-            if output_preconfig.exists():
-                shutil.rmtree(output_preconfig)
-            shutil.copytree(nova_preconfig, output_preconfig)
+    # Version directories are independent; process them concurrently and
+    # print the collected logs once the workers join
+    version_dirs = _versions("chains")
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 4) * 2)) as executor:
+        logs = executor.map(
+            lambda d: _sync_chains_version(d, pezkuwi_chains, blocked_ids),
+            version_dirs,
+        )
+        for log in logs:
+            if log:
+                print(log)
 
 
 def sync_xcm():
@@ -158,60 +436,178 @@ def sync_xcm():
     print(f"  Pezkuwi XCM: {len(pezkuwi_xcm.get('chains', []))} chains")
     print(f"  Pezkuwi XCM dynamic: {len(pezkuwi_xcm_dynamic.get('chains', []))} chains")
 
-    for version_dir in sorted(NOVA_BASE.glob("xcm/v*")):
+    # Computed once here instead of per merge_xcm call
+    pezkuwi_xcm_ids = frozenset(c['chainId'] for c in pezkuwi_xcm.get('chains', []))
+    pezkuwi_xcm_dynamic_ids = frozenset(c['chainId'] for c in pezkuwi_xcm_dynamic.get('chains', []))
+
+    def sync_xcm_version(version_dir: Path) -> str:
+        """Merge one xcm/v* directory; returns the log lines to print."""
         version = version_dir.name
         output_dir = OUTPUT_XCM / version
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        for nova_file in version_dir.glob("*.json"):
-            filename = nova_file.name
+        _ensure_dir(os.fspath(output_dir))
+        log = []
+
+        # One scandir instead of glob's Path-per-entry, and each input/output
+        # Path is constructed exactly once
+        with os.scandir(version_dir) as it:
+            filenames = sorted(e.name for e in it if e.is_file() and e.name.endswith('.json'))
+
+        for filename in filenames:
+            nova_file = version_dir / filename
+            output_file = output_dir / filename
+            if input_unchanged(nova_file, [output_file]):
+                continue
             nova_data = load_json(nova_file)
 
             # Choose overlay based on filename
             if 'dynamic' in filename:
-                overlay = pezkuwi_xcm_dynamic
+                overlay, overlay_ids = pezkuwi_xcm_dynamic, pezkuwi_xcm_dynamic_ids
             else:
-                overlay = pezkuwi_xcm
+                overlay, overlay_ids = pezkuwi_xcm, pezkuwi_xcm_ids
 
-            merged = merge_xcm(nova_data, overlay)
-            save_json(output_dir / filename, merged)
-            print(f"  {version}/{filename}: {len(merged.get('chains', []))} chains")
+            merged = merge_xcm(nova_data, overlay, overlay_ids)
+            save_json(output_file, merged)
+            log.append(f"  {version}/{filename}: {len(merged.get('chains', []))} chains")
 
-    # Root XCM files
+        return "\n".join(log)
+
+    # Version directories are independent; process them concurrently and
+    # print the collected logs once the workers join
+    version_dirs = _versions("xcm")
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 4) * 2)) as executor:
+        for log in executor.map(sync_xcm_version, version_dirs):
+            if log:
+                print(log)
+
+    # Root XCM files (direct copies - the merged writes are deferred, so the
+    # output dir may not exist yet)
+    _ensure_dir(os.fspath(OUTPUT_XCM))
     for xcm_file in NOVA_BASE.glob("xcm/*.json"):
         shutil.copy(xcm_file, OUTPUT_XCM / xcm_file.name)
 
 
+def _walk_files(root: str):
+    """Yield a DirEntry for every file under root via scandir.
+
+    DirEntry carries the type (and caches the stat) from the directory read,
+    so callers get size/mtime without issuing fresh stat calls per file.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _is_current(src_st: os.stat_result, dst: str) -> bool:
+    """True when dst already matches the source stat by size and is at least as new."""
+    try:
+        dst_st = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    return dst_st.st_size == src_st.st_size and dst_st.st_mtime >= src_st.st_mtime
+
+
+def _copy_file(src: str, dst: str):
+    """Copy bytes in-kernel; icons need no mode preservation, so the
+    stat+chmod overhead of shutil.copy is skipped entirely."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        try:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            if remaining == 0:
+                return
+        except (AttributeError, OSError):
+            # copy_file_range missing (non-Linux) or refused by the filesystem
+            pass
+        fdst.seek(0)
+        fdst.truncate()
+        try:
+            os.sendfile(fdst.fileno(), fsrc.fileno(), 0, size)
+        except (AttributeError, OSError):
+            fsrc.seek(0)
+            shutil.copyfileobj(fsrc, fdst)
+
+
+def _link_or_copy(src: str, dst: str, overwrite: bool = False):
+    """Hardlink src to dst when possible, falling back to a byte copy.
+
+    Parent directories are created by the caller before dispatch.
+    """
+    if overwrite:
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        _copy_file(src, dst)
+
+
 def sync_icons():
-    print("\nSyncing icons...")
+    # Progress lines are buffered and written once - one stdout syscall
+    # instead of one per synced icon
+    log = ["\nSyncing icons..."]
 
     nova_icons = NOVA_BASE / "icons"
     pezkuwi_icons = PEZKUWI_OVERLAY / "icons"
-    output_icons = ROOT / "icons"
+    output_root = os.fspath(ROOT / "icons")
+
+    # Keyed by relative path so a Pezkuwi override replaces the Nova copy of
+    # the same icon instead of racing it in the pool
+    tasks: dict[str, tuple[str, str, bool]] = {}
+
+    # Index the destination once - a single walk instead of an exists/stat
+    # probe per source file
+    existing = set()
+    if os.path.isdir(output_root):
+        out_prefix_len = len(output_root) + 1
+        existing = {entry.path[out_prefix_len:] for entry in _walk_files(output_root)}
 
     # Copy Nova icons (don't overwrite existing)
     if nova_icons.exists():
-        for icon_dir in nova_icons.iterdir():
-            if icon_dir.is_dir():
-                output_dir = output_icons / icon_dir.name
-                output_dir.mkdir(parents=True, exist_ok=True)
-                for icon_file in icon_dir.rglob("*"):
-                    if icon_file.is_file():
-                        rel = icon_file.relative_to(icon_dir)
-                        target = output_dir / rel
-                        if not target.exists():
-                            target.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy(icon_file, target)
-
-    # Copy Pezkuwi icons (override Nova)
+        nova_root = os.fspath(nova_icons)
+        prefix_len = len(nova_root) + 1
+        with os.scandir(nova_root) as it:
+            icon_dirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+        for icon_dir in icon_dirs:
+            for entry in _walk_files(icon_dir):
+                rel = entry.path[prefix_len:]
+                if rel not in existing:
+                    tasks[rel] = (entry.path, os.path.join(output_root, rel), False)
+
+    # Copy Pezkuwi icons (override Nova, skipped when already up to date)
     if pezkuwi_icons.exists():
-        for icon_file in pezkuwi_icons.rglob("*"):
-            if icon_file.is_file():
-                rel = icon_file.relative_to(pezkuwi_icons)
-                target = output_icons / rel
-                target.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(icon_file, target)
-                print(f"  Pezkuwi: {rel}")
+        pezkuwi_root = os.fspath(pezkuwi_icons)
+        prefix_len = len(pezkuwi_root) + 1
+        for entry in _walk_files(pezkuwi_root):
+            rel = entry.path[prefix_len:]
+            target = os.path.join(output_root, rel)
+            if rel in existing and rel not in tasks and _is_current(entry.stat(), target):
+                continue
+            tasks[rel] = (entry.path, target, True)
+            log.append(f"  Pezkuwi: {rel}")
+
+    # The copies are independent and I/O-bound - dispatch them in parallel,
+    # after creating the (de-duplicated) parent directories in one pass
+    if tasks:
+        for parent in {os.path.dirname(target) for _, target, _ in tasks.values()}:
+            _ensure_dir(parent)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for _ in executor.map(lambda task: _link_or_copy(*task), tasks.values()):
+                pass
+
+    sys.stdout.write("\n".join(log) + "\n")
+    sys.stdout.flush()
 
 
 def merge_config(nova_config: dict, pezkuwi_overlay: dict) -> dict:
@@ -256,17 +652,16 @@ def sync_config():
         label = "production" if suffix == "" else "dev"
         print(f"  {label}: {list(merged.keys())}")
 
-    # Copy validators from Nova (if present)
+    # Copy validators from Nova (if present); the merged config writes are
+    # deferred to flush_writes, so the output dir may not exist yet
     nova_validators = NOVA_BASE / "staking" / "nova_validators.json"
     if nova_validators.exists():
+        _ensure_dir(os.fspath(OUTPUT_STAKING))
         shutil.copy(nova_validators, OUTPUT_STAKING / "nova_validators.json")
 
     nova_validators_dir = NOVA_BASE / "staking" / "validators"
     if nova_validators_dir.exists():
-        output_validators = OUTPUT_STAKING / "validators"
-        if output_validators.exists():
-            shutil.rmtree(output_validators)
-        shutil.copytree(nova_validators_dir, output_validators)
+        sync_tree(nova_validators_dir, OUTPUT_STAKING / "validators")
 
 
 def main():
@@ -282,10 +677,13 @@ def main():
         print("Run: git submodule update --init --recursive")
         return 1
 
+    load_sync_cache()
     sync_chains()
     sync_xcm()
     sync_icons()
     sync_config()
+    flush_writes()
+    save_sync_cache()
 
     print("\n" + "=" * 60)
     print("Done!")